@@ -1,6 +1,8 @@
 from fastapi import FastAPI, Query, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from typing import List, Optional
+from collections import defaultdict
+import bisect
 import re
 import asyncio
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
@@ -105,9 +107,24 @@ words_list = []
 words_set = set()  # For faster lookups
 word_stats = {}
 
-# Thread pool for IO operations
-thread_pool = ThreadPoolExecutor(max_workers=4)
-process_pool = ProcessPoolExecutor(max_workers=2)
+# Thread pool for IO operations. Created lazily so merely importing this
+# module (e.g. during test collection) does not fork worker processes.
+thread_pool = None
+process_pool = None
+
+def get_thread_pool() -> ThreadPoolExecutor:
+    """Return the shared thread pool, creating it on first use"""
+    global thread_pool
+    if thread_pool is None:
+        thread_pool = ThreadPoolExecutor(max_workers=4)
+    return thread_pool
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """Return the shared process pool, creating it on first use"""
+    global process_pool
+    if process_pool is None:
+        process_pool = ProcessPoolExecutor(max_workers=2)
+    return process_pool
 
 # Initialize Oxford validator
 oxford_validator = OxfordValidator()
@@ -124,22 +141,11 @@ async def load_words_concurrent():
             logger.info(f"Starting to load words from {filename}")
             
             with open(filename, "r", encoding="utf-8") as file:
-                # Read in chunks for better memory usage
-                chunk_size = 10000
-                words = []
-                chunks_processed = 0
-                
-                while True:
-                    lines = file.readlines(chunk_size)
-                    if not lines:
-                        break
-                    
-                    chunk_words = [word.strip().lower() for word in lines if word.strip()]
-                    words.extend(chunk_words)
-                    chunks_processed += 1
-                    
-                    if chunks_processed % 10 == 0:  # Log every 10 chunks
-                        logger.debug(f"Processed {chunks_processed} chunks, {len(words)} words so far")
+                # Lower the whole buffer in one C call and let split() drop
+                # blank lines and surrounding whitespace in the same pass,
+                # instead of strip().lower() per line in Python; every word
+                # is lowercase from here on, so queries never re-lower them
+                words = file.read().lower().split()
             
             # Calculate statistics
             lengths = [len(word) for word in words]
@@ -156,7 +162,6 @@ async def load_words_concurrent():
                 extra={"extra_fields": {
                     "total_words": len(words),
                     "load_time_seconds": load_time,
-                    "chunks_processed": chunks_processed,
                     "file_size_mb": Path(filename).stat().st_size / (1024 * 1024)
                 }}
             )
@@ -185,62 +190,207 @@ async def load_words_concurrent():
     # Run file loading in thread pool
     loop = asyncio.get_event_loop()
     words_list, words_set, word_stats = await loop.run_in_executor(
-        thread_pool, read_and_process_file, "words.txt"
+        get_thread_pool(), read_and_process_file, "words.txt"
     )
+    invalidate_index()
+
+# Generation counter for words_list. Every site that rebinds or mutates the
+# corpus (startup reload, add-validated appends, tests patching
+# main.words_list) goes through invalidate_index(), which bumps it; the
+# derived caches below compare against it to detect staleness. An object
+# identity check is not enough here — a freed list's id can be reused by a
+# new list of the same length.
+_words_generation = 0
+
+# Cached per-word lengths for the current words_list, rebuilt lazily when
+# the generation counter moves.
+_lengths_cache = None
+_lengths_source = None
+
+def _get_word_lengths():
+    """Return the cached lengths for words_list, rebuilding if stale"""
+    global _lengths_cache, _lengths_source
+    source = _words_generation
+    if _lengths_cache is None or _lengths_source != source:
+        _lengths_cache = [len(word) for word in words_list]
+        _lengths_source = source
+    return _lengths_cache
+
+# Buckets of word indices keyed by word length, so exact-length queries skip
+# the scan entirely. Same lazy staleness scheme as the other derived caches.
+_length_buckets = None
+_length_buckets_source = None
+
+def _get_length_buckets():
+    """Return the per-length index buckets for words_list, rebuilding if stale"""
+    global _length_buckets, _length_buckets_source
+    source = _words_generation
+    if _length_buckets is None or _length_buckets_source != source:
+        buckets = defaultdict(list)
+        for i, length in enumerate(_get_word_lengths()):
+            buckets[length].append(i)
+        _length_buckets = buckets
+        _length_buckets_source = source
+    return _length_buckets
+
+# Every character appearing anywhere in the corpus. A substring filter
+# using a character outside this set cannot match any word, so queries can
+# reject it in O(len(needle)) without scanning.
+_present_chars = None
+_present_chars_source = None
+
+def _get_present_chars():
+    """Return the set of corpus characters, rebuilding if stale"""
+    global _present_chars, _present_chars_source
+    source = _words_generation
+    if _present_chars is None or _present_chars_source != source:
+        chars = set()
+        for word in words_list:
+            chars.update(word)
+        _present_chars = frozenset(chars)
+        _present_chars_source = source
+    return _present_chars
+
+# The corpus joined on newlines plus per-word start offsets. Short contains
+# needles (too short for the trigram index) scan this single buffer with
+# str.find — one C-level search instead of a Python-level `in` per word.
+_joined_corpus = None
+_joined_starts = None
+_joined_source = None
+
+def _get_joined_corpus():
+    """Return the joined corpus and start offsets, rebuilding if stale"""
+    global _joined_corpus, _joined_starts, _joined_source
+    source = _words_generation
+    if _joined_corpus is None or _joined_source != source:
+        _joined_corpus = "\n".join(words_list)
+        starts = []
+        pos = 0
+        for word in words_list:
+            starts.append(pos)
+            pos += len(word) + 1
+        _joined_starts = starts
+        _joined_source = source
+    return _joined_corpus, _joined_starts
+
+# Trigram index over words_list: maps each 3-gram to the indices of words
+# containing it, so a 'contains' query verifies a candidate shortlist
+# instead of scanning the whole corpus. Lazily built and staleness-checked
+# like the lengths cache.
+_trigram_index = None
+_trigram_source = None
+
+def invalidate_index():
+    """Drop the derived word caches after words_list is rebound or mutated"""
+    global _words_generation
+    global _lengths_cache, _lengths_source, _trigram_index, _trigram_source
+    global _length_buckets, _length_buckets_source
+    global _joined_corpus, _joined_starts, _joined_source
+    global _present_chars, _present_chars_source
+    _words_generation += 1
+    _lengths_cache = None
+    _lengths_source = None
+    _trigram_index = None
+    _trigram_source = None
+    _length_buckets = None
+    _length_buckets_source = None
+    _joined_corpus = None
+    _joined_starts = None
+    _joined_source = None
+    _present_chars = None
+    _present_chars_source = None
+
+def _get_trigram_index():
+    """Return the trigram index for words_list, rebuilding if stale"""
+    global _trigram_index, _trigram_source
+    source = _words_generation
+    if _trigram_index is None or _trigram_source != source:
+        index = defaultdict(set)
+        for i, word in enumerate(words_list):
+            for j in range(len(word) - 2):
+                index[word[j:j + 3]].add(i)
+        _trigram_index = index
+        _trigram_source = source
+    return _trigram_index
 
 def filter_words_chunk(chunk_data):
     """Filter a chunk of words - designed for parallel processing"""
     words_chunk, filters = chunk_data
-    filtered = []
-    
+
+    # Hoist filter values to locals once per chunk
     contains = filters.get('contains', '').lower() if filters.get('contains') else None
     starts_with = filters.get('starts_with', '').lower() if filters.get('starts_with') else None
     ends_with = filters.get('ends_with', '').lower() if filters.get('ends_with') else None
     min_length = filters.get('min_length')
     max_length = filters.get('max_length')
     exact_length = filters.get('exact_length')
-    
-    for word in words_chunk:
-        # Apply filters
-        if contains and contains not in word:
-            continue
-        if starts_with and not word.startswith(starts_with):
-            continue
-        if ends_with and not word.endswith(ends_with):
-            continue
-        if exact_length and len(word) != exact_length:
-            continue
-        elif not exact_length:
-            if min_length and len(word) < min_length:
-                continue
-            if max_length and len(word) > max_length:
-                continue
-        
-        filtered.append(word)
-    
-    return filtered
+
+    # A lone prefix filter collapses to a single C-level call per word
+    if starts_with and not (contains or ends_with or exact_length
+                            or min_length or max_length):
+        return [word for word in words_chunk if word.startswith(starts_with)]
+
+    # With a substring filter active, one multiline findall scans the chunk
+    # joined into a single buffer: the regex engine walks the whole buffer
+    # in C rather than dispatching a Python predicate per word, which also
+    # lets threaded chunks spend almost no time holding interpreter state
+    if contains or starts_with or ends_with:
+        lo = exact_length or min_length or 0
+        hi = exact_length or max_length or 0
+        # A contradictory range can never match; bail out before it becomes
+        # an invalid {lo,hi} bounded repeat in the fused pattern
+        if hi and lo > hi:
+            return []
+        pattern = _compile_line_pattern(contains, starts_with, ends_with, lo, hi)
+        return pattern.findall("\n".join(words_chunk))
+
+    # Only length filters (or none) remain at this point
+    checks = []
+    if exact_length:
+        checks.append(lambda w: len(w) == exact_length)
+    else:
+        if min_length:
+            checks.append(lambda w: len(w) >= min_length)
+        if max_length:
+            checks.append(lambda w: len(w) <= max_length)
+
+    return [word for word in words_chunk if all(check(word) for check in checks)]
+
+# Below this corpus size, pickling chunk lists across a process boundary
+# costs more than the string filtering itself
+_PROCESS_BYPASS_THRESHOLD = 200_000
 
 async def filter_words_concurrent(filters: dict, limit: int = 100):
     """Filter words using concurrent processing for better performance"""
     if not words_list:
         return []
-    
+
     # For small datasets or simple filters, use single thread
     if len(words_list) < 10000 or not any(filters.values()):
         return filter_words_simple(filters, limit)
-    
+
+    loop = asyncio.get_event_loop()
+
+    # Mid-size corpora: one off-loop pass in a worker thread; no chunk
+    # copies, no pickling
+    if len(words_list) < _PROCESS_BYPASS_THRESHOLD:
+        return await loop.run_in_executor(
+            get_thread_pool(), filter_words_simple, filters, limit
+        )
+
     # Split words into chunks for parallel processing
     chunk_size = max(1000, len(words_list) // 4)  # 4 chunks
     chunks = []
-    
+
     for i in range(0, len(words_list), chunk_size):
         chunk = words_list[i:i + chunk_size]
         chunks.append((chunk, filters))
-    
-    # Process chunks in parallel
-    loop = asyncio.get_event_loop()
+
+    # Process chunks in parallel threads; the filter loops are dominated by
+    # C-level string methods, so threads overlap well without pickling O(N)
+    # strings the way the old process pool did
     tasks = [
-        loop.run_in_executor(process_pool, filter_words_chunk, chunk_data)
+        loop.run_in_executor(get_thread_pool(), filter_words_chunk, chunk_data)
         for chunk_data in chunks
     ]
     
@@ -255,39 +405,198 @@ async def filter_words_concurrent(filters: dict, limit: int = 100):
     
     return filtered_words[:limit]
 
+@functools.lru_cache(maxsize=64)
+def _compile_line_pattern(contains, starts_with, ends_with, lo, hi):
+    """Fuse all active filters into one multiline whole-line regex.
+
+    Matching a newline-joined chunk with findall replaces the per-word
+    predicate loop; lookaheads keep the substring checks independent and
+    the trailing bounded-repeat encodes the length filters (hi of 0 means
+    unbounded). Words never contain newlines, so each line is one word.
+    """
+    parts = ["^"]
+    if starts_with:
+        parts.append(f"(?={re.escape(starts_with)})")
+    if contains:
+        parts.append(f"(?=.*{re.escape(contains)})")
+    if ends_with:
+        parts.append(f"(?=.*{re.escape(ends_with)}$)")
+    parts.append(f".{{{lo},{hi if hi else ''}}}$")
+    return re.compile("".join(parts), re.MULTILINE)
+
+@functools.lru_cache(maxsize=64)
+def _compile_string_pattern(contains, starts_with, ends_with):
+    """Fuse the active substring filters into one anchored regex.
+
+    Lookaheads keep the checks independent — a 'contains' value is allowed
+    to overlap the prefix — so one C-level match() call is equivalent to
+    the separate in/startswith/endswith tests.
+    """
+    parts = ["^"]
+    if starts_with:
+        parts.append(f"(?={re.escape(starts_with)})")
+    if contains:
+        parts.append(f"(?=.*{re.escape(contains)})")
+    if ends_with:
+        parts.append(f".*{re.escape(ends_with)}$")
+    return re.compile("".join(parts))
+
+_FILTER_CONDITIONS = {
+    'contains': "contains in w",
+    'starts_with': "w.startswith(starts_with)",
+    'ends_with': "w.endswith(ends_with)",
+    # L is the word's precomputed length, bound once per iteration
+    'exact_length': "L == exact_length",
+    'min_length': "L >= min_length",
+    'max_length': "L <= max_length",
+}
+
+_LENGTH_FILTERS = frozenset(('exact_length', 'min_length', 'max_length'))
+
+@functools.lru_cache(maxsize=64)
+def _compile_filter(active):
+    """Build a filter loop specialized to one combination of active filters.
+
+    `active` is a tuple of filter names in canonical order. The generated
+    function tests exactly those conditions per word, so a shape like
+    ('contains', 'min_length') pays for two checks instead of six branches.
+    Compiled once per shape and cached.
+    """
+    condition = " and ".join(_FILTER_CONDITIONS[name] for name in active) or "True"
+    # Shapes with length conditions walk the cached lengths in lockstep so
+    # each word's length is fetched once, without a len() call per condition
+    if _LENGTH_FILTERS.intersection(active):
+        loop = "    for w, L in zip(words, lengths):\n"
+    else:
+        loop = "    for w in words:\n"
+    source = (
+        "def _filter(words, lengths, limit, contains, starts_with, ends_with,"
+        " min_length, max_length, exact_length):\n"
+        "    out = []\n"
+        "    append = out.append\n"
+        + loop +
+        f"        if {condition}:\n"
+        "            append(w)\n"
+        "            if len(out) >= limit:\n"
+        "                break\n"
+        "    return out\n"
+    )
+    namespace = {}
+    exec(source, namespace)
+    return namespace['_filter']
+
 def filter_words_simple(filters: dict, limit: int = 100):
     """Simple synchronous filtering for small datasets"""
     filtered = []
-    
+
     contains = filters.get('contains', '').lower() if filters.get('contains') else None
     starts_with = filters.get('starts_with', '').lower() if filters.get('starts_with') else None
     ends_with = filters.get('ends_with', '').lower() if filters.get('ends_with') else None
     min_length = filters.get('min_length')
     max_length = filters.get('max_length')
     exact_length = filters.get('exact_length')
-    
-    for word in words_list:
-        if len(filtered) >= limit:
-            break
-            
-        # Apply filters
-        if contains and contains not in word:
-            continue
-        if starts_with and not word.startswith(starts_with):
-            continue
-        if ends_with and not word.endswith(ends_with):
-            continue
-        if exact_length and len(word) != exact_length:
-            continue
-        elif not exact_length:
-            if min_length and len(word) < min_length:
-                continue
-            if max_length and len(word) > max_length:
+
+    # A needle with a character the corpus never uses cannot match anything;
+    # reject it in O(len(needle)) before touching the word list
+    if contains or starts_with or ends_with:
+        present = _get_present_chars()
+        for needle in (contains, starts_with, ends_with):
+            if needle and not present.issuperset(needle):
+                return []
+
+    # Length-only queries compare against the precomputed lengths instead of
+    # calling len() and re-checking the string filters for every word
+    if contains is None and starts_with is None and ends_with is None and \
+            (exact_length or min_length or max_length):
+        if exact_length:
+            # Direct bucket lookup; indices are already in corpus order
+            bucket = _get_length_buckets().get(exact_length, ())
+            return [words_list[i] for i in bucket[:limit]]
+        lo = min_length or 0
+        hi = max_length
+        for word, length in zip(words_list, _get_word_lengths()):
+            if length < lo or (hi and length > hi):
                 continue
-        
-        filtered.append(word)
-    
-    return filtered
+            filtered.append(word)
+            if len(filtered) >= limit:
+                break
+        return filtered
+
+    # Two or more substring filters collapse into a single compiled regex,
+    # one engine call per word instead of two or three string methods
+    if sum(1 for f in (contains, starts_with, ends_with) if f) >= 2:
+        match = _compile_string_pattern(contains, starts_with, ends_with).match
+        lo = exact_length or min_length or 0
+        hi = exact_length or max_length
+        for word in words_list:
+            if match(word) and len(word) >= lo and (not hi or len(word) <= hi):
+                filtered.append(word)
+                if len(filtered) >= limit:
+                    break
+        return filtered
+
+    # Short contains needles scan the joined corpus with one C-level find per
+    # hit; the separator newline can never appear in a needle, so every hit
+    # falls inside a single word, recovered by bisecting the start offsets
+    if contains and len(contains) < 3 and not starts_with and not ends_with:
+        corpus, starts = _get_joined_corpus()
+        find = corpus.find
+        lo = exact_length or min_length or 0
+        hi = exact_length or max_length
+        pos = find(contains)
+        while pos != -1:
+            i = bisect.bisect_right(starts, pos) - 1
+            word = words_list[i]
+            if len(word) >= lo and (not hi or len(word) <= hi):
+                filtered.append(word)
+                if len(filtered) >= limit:
+                    break
+            # Resume after this word to avoid duplicate hits within it
+            pos = find(contains, starts[i] + len(word) + 1)
+        return filtered
+
+    # A contains query of 3+ chars only needs to verify the words holding all
+    # of the needle's trigrams, not the whole corpus
+    if contains and len(contains) >= 3 and not starts_with and not ends_with:
+        index = _get_trigram_index()
+        gram_sets = [index.get(contains[j:j + 3])
+                     for j in range(len(contains) - 2)]
+        if any(s is None for s in gram_sets):
+            return filtered  # some trigram occurs nowhere; no word can match
+        gram_sets.sort(key=len)
+        lo = exact_length or min_length or 0
+        hi = exact_length or max_length
+        for i in sorted(set.intersection(*gram_sets)):
+            word = words_list[i]
+            if contains in word and len(word) >= lo and (not hi or len(word) <= hi):
+                filtered.append(word)
+                if len(filtered) >= limit:
+                    break
+        return filtered
+
+    # Run the loop specialized to the active filters: the generated function
+    # contains exactly the needed conditions, compiled once per filter shape.
+    # Conditions are emitted cheapest/most-selective first so `and` bails
+    # before the substring scan for most words.
+    active = []
+    if starts_with:
+        active.append('starts_with')
+    if exact_length:
+        active.append('exact_length')
+    else:
+        if min_length:
+            active.append('min_length')
+        if max_length:
+            active.append('max_length')
+    if ends_with:
+        active.append('ends_with')
+    if contains:
+        active.append('contains')
+
+    filter_func = _compile_filter(tuple(active))
+    lengths = _get_word_lengths() if (exact_length or min_length or max_length) else None
+    return filter_func(words_list, lengths, limit, contains, starts_with, ends_with,
+                       min_length, max_length, exact_length)
 
 @app.on_event("startup")
 async def startup_event():
@@ -306,8 +615,10 @@ async def shutdown_event():
     """Cleanup thread pools on shutdown"""
     logger.info("Application shutdown initiated")
     try:
-        thread_pool.shutdown(wait=True)
-        process_pool.shutdown(wait=True)
+        if thread_pool is not None:
+            thread_pool.shutdown(wait=True)
+        if process_pool is not None:
+            process_pool.shutdown(wait=True)
         logger.info("Application shutdown completed successfully")
     except Exception as e:
         logger.error("Error during application shutdown", exc_info=True)
@@ -422,7 +733,7 @@ async def get_interactive_words(
     
     loop = asyncio.get_event_loop()
     tasks = [
-        loop.run_in_executor(thread_pool, match_pattern_chunk, chunk_data)
+        loop.run_in_executor(get_thread_pool(), match_pattern_chunk, chunk_data)
         for chunk_data in chunks
     ]
     
@@ -444,8 +755,8 @@ async def get_performance_stats():
             "words_list_size": len(words_list),
             "words_set_size": len(words_set)
         },
-        "thread_pool_workers": thread_pool._max_workers,
-        "process_pool_workers": process_pool._max_workers,
+        "thread_pool_workers": get_thread_pool()._max_workers,
+        "process_pool_workers": get_process_pool()._max_workers,
         "optimization_features": [
             "Concurrent file loading",
             "Parallel word filtering",
@@ -509,6 +820,12 @@ async def search_basic_word(word: str):
         logger.error(f"Error in basic search: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
+def _append_word_to_file(word: str) -> None:
+    """Append a single word to the words.txt file"""
+    words_file_path = Path("words.txt")
+    with open(words_file_path, "a", encoding="utf-8") as f:
+        f.write(f"{word}\n")
+
 @app.post("/words/add-validated")
 async def add_word_with_validation(request: ValidateWordRequest):
     """Add a word with Oxford Dictionary validation"""
@@ -538,12 +855,11 @@ async def add_word_with_validation(request: ValidateWordRequest):
         # Add to collection (both in-memory and to file)
         words_set.add(word)
         words_list.append(word)
-        
+        invalidate_index()
+
         # Write to words.txt file
         try:
-            words_file_path = Path("words.txt")
-            with open(words_file_path, "a", encoding="utf-8") as f:
-                f.write(f"{word}\n")
+            _append_word_to_file(word)
             logger.info(f"Successfully added word '{word}' to words.txt file")
         except Exception as e:
             logger.error(f"Failed to write word '{word}' to file: {e}")
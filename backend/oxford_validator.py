@@ -1,8 +1,10 @@
 import requests
 from bs4 import BeautifulSoup
+import json
 import logging
 import asyncio
 import aiohttp
+import sqlite3
 from typing import Dict, List, Optional, Tuple
 from concurrent.futures import ThreadPoolExecutor
 import time
@@ -24,6 +26,14 @@ class OxfordValidator:
         })
         self.executor = ThreadPoolExecutor(max_workers=3)  # Limit concurrent requests
         self.cache = {}  # Simple in-memory cache
+        # Disk-backed cache so validation results survive restarts; WAL
+        # keeps readers unblocked during the bulk writes
+        self.cache_db = sqlite3.connect('oxford_validator_cache.db', check_same_thread=False)
+        self.cache_db.execute('PRAGMA journal_mode=WAL')
+        self.cache_db.execute(
+            'CREATE TABLE IF NOT EXISTS results(word TEXT PRIMARY KEY, result TEXT)'
+        )
+        self.cache_db.commit()
         self.rate_limit_delay = 1  # 1 second between requests to be respectful
         self.last_request_time = 0
         
@@ -53,16 +63,17 @@ class OxfordValidator:
             }
         
         # Check cache first
-        if word in self.cache:
+        cached = self.get_cached(word)
+        if cached is not None:
             logger.info(f"Cache hit for word: {word}")
-            return self.cache[word]
-        
+            return cached
+
         try:
             loop = asyncio.get_event_loop()
             result = await loop.run_in_executor(self.executor, self._fetch_word_sync, word)
-            
+
             # Cache the result
-            self.cache[word] = result
+            self.put_cached(word, result)
             return result
             
         except Exception as e:
@@ -76,6 +87,34 @@ class OxfordValidator:
                 "reason": f"Error during validation: {str(e)}"
             }
     
+    def get_cached(self, word: str) -> Optional[Dict]:
+        """Look up a validation result in the memory or disk cache"""
+        result = self.cache.get(word)
+        if result is not None:
+            return result
+
+        row = self.cache_db.execute(
+            'SELECT result FROM results WHERE word = ?', (word,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        result = json.loads(row[0])
+        self.cache[word] = result
+        return result
+
+    def put_cached(self, word: str, result: Dict) -> None:
+        """Cache a validation result in memory and, if conclusive, on disk"""
+        self.cache[word] = result
+        # Transient failures shouldn't be remembered across runs
+        if result["reason"].startswith(("Network error", "HTTP error", "Error")):
+            return
+        with self.cache_db:
+            self.cache_db.execute(
+                'INSERT OR REPLACE INTO results(word, result) VALUES (?, ?)',
+                (word, json.dumps(result))
+            )
+
     def _fetch_word_sync(self, word: str) -> Dict:
         """Synchronous word fetching for use with ThreadPoolExecutor"""
         
@@ -6,6 +6,8 @@ Validates all words in words.txt and creates invalid_words.txt
 
 import asyncio
 import logging
+import mmap
+import sqlite3
 import sys
 from pathlib import Path
 from typing import List, Dict
@@ -15,24 +17,99 @@ from oxford_validator import OxfordValidator
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+class AdaptiveRateLimiter:
+    """Paces batch starts against the Oxford API.
+
+    Batches run at full speed while requests succeed; when one fails in a
+    way that looks like throttling, later batches are spaced out by a
+    backoff interval (starting at the old fixed 2-second pause) that decays
+    again once responses come back clean.
+    """
+
+    def __init__(self, fallback_interval: float = 2.0, max_interval: float = 30.0):
+        self._interval = 0.0
+        self._fallback_interval = fallback_interval
+        self._max_interval = max_interval
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until the next batch is allowed to start"""
+        async with self._lock:
+            now = asyncio.get_event_loop().time()
+            wait = self._next_start - now
+            self._next_start = max(now, self._next_start) + self._interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def record_success(self):
+        """Decay the pacing interval after a clean batch"""
+        self._interval /= 2
+        if self._interval < 0.1:
+            self._interval = 0.0
+
+    def record_throttle(self):
+        """Back off after a failure that looks rate-limited"""
+        self._interval = min(
+            max(self._interval * 2, self._fallback_interval), self._max_interval
+        )
+
+
 class WordValidationProcessor:
     def __init__(self):
         self.oxford_validator = OxfordValidator()
         self.words_file = "words.txt"
         self.invalid_words_file = "invalid_words.txt"
-        
+        # Persistent word -> is_valid cache so reruns only hit Oxford for
+        # words the script has never seen before
+        self.cache = sqlite3.connect("oxford_cache.db")
+        self.cache.execute(
+            "CREATE TABLE IF NOT EXISTS v(word TEXT PRIMARY KEY, is_valid INTEGER)"
+        )
+        self.cache.commit()
+
+    def _load_cached_results(self, words: List[str]) -> Dict[str, bool]:
+        """Look up previously validated words, chunked to respect sqlite's
+        bound-parameter limit"""
+        cached = {}
+        for i in range(0, len(words), 500):
+            chunk = words[i:i + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.cache.execute(
+                f"SELECT word, is_valid FROM v WHERE word IN ({placeholders})", chunk
+            )
+            cached.update((word, bool(is_valid)) for word, is_valid in rows)
+        return cached
+
+    def _store_results(self, results: List[Dict]):
+        """Upsert a batch of validation results in one transaction"""
+        with self.cache:
+            self.cache.executemany(
+                "INSERT OR REPLACE INTO v(word, is_valid) VALUES (?, ?)",
+                [(r["word"], int(r["is_valid"])) for r in results]
+            )
+
     def load_words(self) -> List[str]:
         """Load all words from words.txt"""
         try:
-            with open(self.words_file, "r", encoding="utf-8") as file:
-                words = [word.strip().lower() for word in file.readlines() if word.strip()]
-                logger.info(f"Loaded {len(words)} words from {self.words_file}")
-                return words
+            # Map the file and lower/split in C over contiguous memory
+            # instead of materializing a readlines() list and re-stripping
+            # each entry in Python
+            with open(self.words_file, "rb") as file:
+                try:
+                    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        raw = mm[:].lower()
+                except ValueError:  # empty files cannot be mapped
+                    raw = b""
+            words = [w.decode("utf-8") for w in raw.split()]
+            logger.info(f"Loaded {len(words)} words from {self.words_file}")
+            return words
         except FileNotFoundError:
             logger.error(f"File {self.words_file} not found!")
             sys.exit(1)
     
-    async def validate_all_words(self, words: List[str], batch_size: int = 20) -> Dict:
+    async def validate_all_words(self, words: List[str], batch_size: int = 20,
+                                 max_concurrency: int = 8) -> Dict:
         """
         Validate all words using Oxford Dictionary
         
@@ -57,40 +134,74 @@ class WordValidationProcessor:
                 "validation_results": []
             }
         
-        # Process in batches to avoid overwhelming Oxford API
+        # Skip words the cache already knows about; only the remainder ever
+        # reaches the Oxford API
+        cached = self._load_cached_results(words)
+        to_check = [word for word in words if word not in cached]
+        if cached:
+            logger.info(f"Cache hit for {len(cached)} words, {len(to_check)} left to validate")
+
+        # Process in batches; a semaphore keeps at most max_concurrency
+        # batches in flight against the Oxford API at once, so batches
+        # overlap instead of serializing behind a fixed sleep
+        batches = [to_check[i:i + batch_size] for i in range(0, len(to_check), batch_size)]
+        total_batches = len(batches)
+        semaphore = asyncio.Semaphore(max_concurrency)
+        limiter = AdaptiveRateLimiter()
+
+        async def run_batch(batch_num: int, batch: List[str]):
+            async with semaphore:
+                await limiter.acquire()
+                logger.info(f"Processing batch {batch_num}/{total_batches} ({len(batch)} words)")
+                try:
+                    result = await self.oxford_validator.validate_words_batch(batch)
+                except Exception as e:
+                    # Oxford throttling surfaces as 429/rate-limit errors;
+                    # anything else should not slow the remaining batches
+                    message = str(e).lower()
+                    if "429" in message or "rate" in message or "too many" in message:
+                        limiter.record_throttle()
+                    raise
+                limiter.record_success()
+                self._store_results(result["results"])
+                return result
+
+        batch_results = await asyncio.gather(
+            *(run_batch(num, batch) for num, batch in enumerate(batches, start=1)),
+            return_exceptions=True
+        )
+
+        # Cached words are answered locally, in original word order
         all_results = []
         invalid_words = []
-        processed_count = 0
-        
-        for i in range(0, len(words), batch_size):
-            batch = words[i:i + batch_size]
-            batch_num = i//batch_size + 1
-            total_batches = (len(words) + batch_size - 1) // batch_size
-            
-            logger.info(f"Processing batch {batch_num}/{total_batches} ({len(batch)} words)")
-            
-            try:
-                batch_result = await self.oxford_validator.validate_words_batch(batch)
-                all_results.extend(batch_result["results"])
-                
-                # Collect invalid words
-                for result in batch_result["results"]:
-                    if not result["is_valid"]:
-                        invalid_words.append(result["word"])
-                    processed_count += 1
-                
-                # Show progress every 100 words
-                if processed_count % 100 == 0:
-                    logger.info(f"Progress: {processed_count}/{len(words)} words processed")
-                
-                # Small delay between batches to be respectful to Oxford API
-                await asyncio.sleep(2)
-                
-            except Exception as e:
-                logger.error(f"Error processing batch {batch_num}: {e}")
+        for word in words:
+            if word in cached:
+                is_valid = cached[word]
+                all_results.append({"word": word, "is_valid": is_valid, "source": "cache"})
+                if not is_valid:
+                    invalid_words.append(word)
+
+        # gather preserves batch order and every batch but the last holds
+        # batch_size words, so each batch's results land at a fixed offset;
+        # preallocating once and slice-assigning avoids growing the list
+        # through repeated extends
+        checked_results = [None] * len(to_check)
+        for batch_num, batch_result in enumerate(batch_results):
+            if isinstance(batch_result, Exception):
+                logger.error(f"Error processing batch {batch_num + 1}: {batch_result}")
                 # Continue with next batch
                 continue
-        
+
+            results = batch_result["results"]
+            start = batch_num * batch_size
+            checked_results[start:start + len(results)] = results
+
+        # Failed batches leave None slots behind; one pass collects the rest
+        all_results.extend(r for r in checked_results if r is not None)
+        invalid_words.extend(
+            r["word"] for r in checked_results if r is not None and not r["is_valid"]
+        )
+
         valid_count = len(words) - len(invalid_words)
         
         logger.info(f"Validation complete: {valid_count}/{len(words)} words are valid")
@@ -107,9 +218,10 @@ class WordValidationProcessor:
     def save_invalid_words(self, invalid_words: List[str]):
         """Save invalid words to invalid_words.txt"""
         try:
-            with open(self.invalid_words_file, "w", encoding="utf-8") as file:
-                for word in sorted(invalid_words):
-                    file.write(f"{word}\n")
+            # One write of one pre-joined buffer instead of a syscall per word
+            data = ("\n".join(sorted(invalid_words)) + "\n").encode("utf-8")
+            with open(self.invalid_words_file, "wb") as file:
+                file.write(data)
             logger.info(f"Saved {len(invalid_words)} invalid words to {self.invalid_words_file}")
         except Exception as e:
             logger.error(f"Error saving invalid words: {e}")
@@ -127,15 +239,17 @@ class WordValidationProcessor:
             
             original_count = len(original_words)
             invalid_set = set(invalid_words)
-            
-            # Filter out invalid words
-            valid_words = [word for word in original_words if word not in invalid_set]
+
+            # Filter out invalid words, preserving file order; binding the
+            # set's __contains__ once avoids the per-word attribute lookup
+            is_invalid = invalid_set.__contains__
+            valid_words = [word for word in original_words if not is_invalid(word)]
             removed_count = original_count - len(valid_words)
             
-            # Save cleaned words back to words.txt
-            with open(self.words_file, "w", encoding="utf-8") as file:
-                for word in valid_words:
-                    file.write(f"{word}\n")
+            # Save cleaned words back to words.txt in a single write
+            data = ("\n".join(valid_words) + "\n").encode("utf-8") if valid_words else b""
+            with open(self.words_file, "wb") as file:
+                file.write(data)
             
             return {
                 "original_count": original_count,
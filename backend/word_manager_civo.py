@@ -1,14 +1,35 @@
+import base64
 import boto3
 import asyncio
+import functools
+import gzip
+import hashlib
 import logging
 import os
+import time
 from typing import List, Dict, Any, Optional, Tuple
 import aiohttp
 import json
-from datetime import datetime
+from botocore.exceptions import ClientError
+from datetime import datetime, timezone
 import tempfile
+import types
 from pathlib import Path
 
+try:
+    # Optional: runs S3 requests natively on the event loop instead of
+    # bouncing each call through the default threadpool
+    import aioboto3
+except ImportError:
+    aioboto3 = None
+
+try:
+    # Optional: same treatment for local file I/O, which otherwise
+    # competes for the default threadpool with the S3 fallback path
+    import aiofiles
+except ImportError:
+    aiofiles = None
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -19,12 +40,43 @@ class CivoWordManager:
     """
     
     def __init__(self):
-        self.words_list = []
+        # words_set is the single source of truth; words_list is a lazily
+        # materialized view of it (see the property below), so each word
+        # is held in exactly one container
         self.words_set = set()
+        self._words_cache: Optional[List[str]] = None
         self.s3_client = None
+        self._aio_session = None
         self.storage_type = "unknown"
         self.storage_info = {}
-        
+
+        # Debounced writer state; the Event and task are created lazily
+        # because __init__ may run before an event loop exists
+        self._dirty: Optional[asyncio.Event] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._pending_appends: List[str] = []
+        self._needs_rewrite = False
+
+        # Bumped on every mutation; stale word_exists cache entries then
+        # miss on the version component of their key
+        self._version = 0
+
+        # ETag of the last words object fetched; reloads send it as
+        # IfNoneMatch so unchanged data never transfers again
+        self._etag: Optional[str] = None
+
+        # Signature of the last add_words batch, paired with the version
+        # it ran against; retried identical batches return immediately
+        self._last_batch_sig: Optional[Tuple[frozenset, int]] = None
+
+        # Last serialized body, keyed by version, so back-to-back
+        # rewrites of an unchanged collection encode only once
+        self._serialized_cache: Optional[Tuple[int, bytes]] = None
+
+        # (timestamp, result) of the last connection test; health checks
+        # hitting it every request reuse the answer for CONN_TEST_TTL
+        self._conn_test_cache: Tuple[float, Optional[Dict[str, Any]]] = (0.0, None)
+
         # Initialize storage based on environment
         self._init_storage()
     
@@ -58,9 +110,10 @@ class CivoWordManager:
                 self._init_file_storage()
                 return
             
-            # Create S3 client for Civo Object Store
-            self.s3_client = boto3.client(
-                's3',
+            # The default config caps the pool at 10 connections and lets
+            # idle sockets close, so concurrent load/save/backup calls
+            # stall on the pool and pay a fresh TLS handshake each time
+            client_kwargs = dict(
                 endpoint_url=endpoint_url,
                 region_name=region,
                 aws_access_key_id=access_key,
@@ -69,15 +122,30 @@ class CivoWordManager:
                     signature_version='s3v4',
                     s3={
                         'addressing_style': 'virtual'
-                    }
+                    },
+                    max_pool_connections=64,
+                    tcp_keepalive=True,
+                    retries={'mode': 'adaptive', 'max_attempts': 5}
                 )
             )
+
+            # Create S3 client for Civo Object Store
+            self.s3_client = boto3.client('s3', **client_kwargs)
+            # With aioboto3 installed, _s3_op runs requests on the event
+            # loop instead; the sync client stays as the fallback
+            self._s3_client_kwargs = client_kwargs
+            self._aio_session = aioboto3.Session() if aioboto3 else None
+            # Keep sockets warm across requests
+            self.s3_client.meta.events.register(
+                'request-created.s3',
+                lambda request, **_: request.headers.update({'Connection': 'keep-alive'})
+            )
             
             self.bucket_name = os.getenv("WORDS_S3_BUCKET", "word-filter-storage")
             self.words_key = os.getenv("WORDS_S3_KEY", "words.txt")
             self.storage_type = "civo_object_store"
             
-            self.storage_info = {
+            self.storage_info = types.MappingProxyType({
                 "provider": "civo",
                 "type": "object_store",
                 "endpoint": endpoint_url,
@@ -85,7 +153,7 @@ class CivoWordManager:
                 "bucket": self.bucket_name,
                 "key": self.words_key,
                 "connected": True
-            }
+            })
             
             logger.info(f"Initialized Civo Object Store: {endpoint_url}/{self.bucket_name}")
             
@@ -97,47 +165,159 @@ class CivoWordManager:
         """Initialize local file storage"""
         self.storage_type = "file"
         self.words_file_path = os.getenv("WORDS_FILE_PATH", "words.txt")
-        
-        self.storage_info = {
+
+        # Create the parent once here instead of stat-ing it every save
+        try:
+            Path(self.words_file_path).parent.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            logger.warning(f"Could not create words directory: {e}")
+
+        self.storage_info = types.MappingProxyType({
             "provider": "local",
             "type": "file",
             "file_path": self.words_file_path,
             "connected": True
-        }
+        })
         
         logger.info(f"Initialized file storage: {self.words_file_path}")
     
+    def _set_connected(self, connected: bool):
+        """Flip the connected flag by rebuilding the frozen info mapping
+
+        storage_info is immutable so get_storage_info can hand it out
+        without copying; connectivity is the only field that ever
+        changes, and it changes rarely enough that a rebuild is cheaper
+        than a copy per read.
+        """
+        if self.storage_info.get("connected") != connected:
+            info = dict(self.storage_info)
+            info["connected"] = connected
+            self.storage_info = types.MappingProxyType(info)
+
+    @property
+    def words_list(self) -> List[str]:
+        """Materialized view of words_set, rebuilt lazily after mutations"""
+        if self._words_cache is None:
+            self._words_cache = list(self.words_set)
+        return self._words_cache
+
+    @words_list.setter
+    def words_list(self, words: List[str]):
+        self._words_cache = words
+
+    async def _s3_op(self, method: str, **kwargs):
+        """Run one S3 operation on whichever client is active
+
+        With aioboto3 installed the request runs natively on the event
+        loop; otherwise the sync boto3 call is pushed to the default
+        threadpool. Every S3 call site goes through this seam.
+        """
+        if self._aio_session is not None:
+            async with self._aio_session.client('s3', **self._s3_client_kwargs) as s3:
+                return await getattr(s3, method)(**kwargs)
+
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            None,
+            lambda: getattr(self.s3_client, method)(**kwargs)
+        )
+
+    @staticmethod
+    def _parse_word_lines(lines) -> Tuple[List[str], set]:
+        """One pass over decoded lines: normalize, dedupe, collect
+
+        Builds the list and set together while streaming, so loading
+        never holds the whole file as one string plus a second list of
+        line strings.
+        """
+        words_list = []
+        words_set = set()
+        for line in lines:
+            word = line.strip().lower()
+            if word and word not in words_set:
+                words_set.add(word)
+                words_list.append(word)
+        return words_list, words_set
+
+    async def _s3_get_words(self, **kwargs) -> Tuple[List[str], set, Optional[str]]:
+        """Stream an object's body line by line into the word structures
+
+        Gzipped objects (ContentEncoding) are decompressed first; plain
+        ones stream straight through iter_lines.
+        """
+        if self._aio_session is not None:
+            async with self._aio_session.client('s3', **self._s3_client_kwargs) as s3:
+                response = await s3.get_object(**kwargs)
+                if response.get('ContentEncoding') == 'gzip':
+                    raw = gzip.decompress(await response['Body'].read())
+                    words_list, words_set = self._parse_word_lines(
+                        line.decode('utf-8') for line in raw.split(b'\n')
+                    )
+                    return words_list, words_set, response.get('ETag')
+                words_list = []
+                words_set = set()
+                async for line in response['Body'].iter_lines(chunk_size=65536):
+                    word = line.decode('utf-8').strip().lower()
+                    if word and word not in words_set:
+                        words_set.add(word)
+                        words_list.append(word)
+                return words_list, words_set, response.get('ETag')
+
+        loop = asyncio.get_event_loop()
+
+        def _get():
+            response = self.s3_client.get_object(**kwargs)
+            if response.get('ContentEncoding') == 'gzip':
+                raw = gzip.decompress(response['Body'].read())
+                lines = (line.decode('utf-8') for line in raw.split(b'\n'))
+            else:
+                lines = (
+                    line.decode('utf-8')
+                    for line in response['Body'].iter_lines(chunk_size=65536)
+                )
+            words_list, words_set = self._parse_word_lines(lines)
+            return words_list, words_set, response.get('ETag')
+
+        return await loop.run_in_executor(None, _get)
+
     async def load_words_from_object_store(self) -> List[str]:
         """Load words from Civo Object Store"""
         if not self.s3_client:
             raise Exception("Object store client not initialized")
-        
+
         try:
-            # Run S3 operation in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None, 
-                lambda: self.s3_client.get_object(Bucket=self.bucket_name, Key=self.words_key)
-            )
-            
-            # Read and process the content
-            content = response['Body'].read().decode('utf-8')
-            words = [word.strip().lower() for word in content.split('\n') if word.strip()]
-            
+            get_kwargs = {'Bucket': self.bucket_name, 'Key': self.words_key}
+            if self._etag:
+                # Conditional GET: unchanged objects come back as a
+                # body-less 304 instead of the full file
+                get_kwargs['IfNoneMatch'] = self._etag
+            words, words_set, etag = await self._s3_get_words(**get_kwargs)
+
             self.words_list = words
-            self.words_set = set(words)
-            
+            self.words_set = words_set
+            self._version += 1
+            self._etag = etag
+
             logger.info(f"Loaded {len(words)} words from Civo Object Store")
             return words
-            
-        except self.s3_client.exceptions.NoSuchKey:
-            logger.warning(f"Words file {self.words_key} not found in bucket {self.bucket_name}")
-            # Create empty file
-            await self._create_empty_words_file()
-            return []
+
+        except ClientError as e:
+            if e.response['Error']['Code'] in ('304', 'NotModified'):
+                logger.info("Words unchanged in object store; keeping in-memory collection")
+                return self.words_list
+            if e.response['Error']['Code'] in ('NoSuchKey', '404'):
+                logger.warning(f"Words file {self.words_key} not found in bucket {self.bucket_name}")
+                # Create empty file
+                await self._create_empty_words_file()
+                return []
+            logger.error(f"Failed to load words from Civo Object Store: {e}")
+            self._set_connected(False)
+            self._conn_test_cache = (0.0, None)
+            raise
         except Exception as e:
             logger.error(f"Failed to load words from Civo Object Store: {e}")
-            self.storage_info["connected"] = False
+            self._set_connected(False)
+            self._conn_test_cache = (0.0, None)
             raise
     
     async def load_words_from_file(self) -> List[str]:
@@ -149,17 +329,29 @@ class CivoWordManager:
                 logger.warning(f"Words file {self.words_file_path} not found, creating with sample words")
                 await self._create_sample_words_file()
             
-            # Read file asynchronously
-            loop = asyncio.get_event_loop()
-            content = await loop.run_in_executor(
-                None,
-                lambda: words_path.read_text(encoding='utf-8')
-            )
-            
-            words = [word.strip().lower() for word in content.split('\n') if word.strip()]
-            
+            # Read file asynchronously, streaming lines instead of
+            # materializing the whole file as one string first
+            if aiofiles is not None:
+                words = []
+                words_set = set()
+                async with aiofiles.open(words_path, 'r', encoding='utf-8') as file:
+                    async for line in file:
+                        word = line.strip().lower()
+                        if word and word not in words_set:
+                            words_set.add(word)
+                            words.append(word)
+            else:
+                loop = asyncio.get_event_loop()
+
+                def _read():
+                    with words_path.open('r', encoding='utf-8', buffering=65536) as file:
+                        return self._parse_word_lines(file)
+
+                words, words_set = await loop.run_in_executor(None, _read)
+
             self.words_list = words
-            self.words_set = set(words)
+            self.words_set = words_set
+            self._version += 1
             
             logger.info(f"Loaded {len(words)} words from file {self.words_file_path}")
             return words
@@ -174,20 +366,62 @@ class CivoWordManager:
             return
         
         try:
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None,
-                lambda: self.s3_client.put_object(
-                    Bucket=self.bucket_name,
-                    Key=self.words_key,
-                    Body="",
-                    ContentType="text/plain"
-                )
+            await self._s3_op(
+                'put_object',
+                Bucket=self.bucket_name,
+                Key=self.words_key,
+                Body="",
+                ContentType="text/plain"
             )
             logger.info("Created empty words file in Civo Object Store")
         except Exception as e:
             logger.error(f"Failed to create empty words file: {e}")
     
+    async def _write_file(self, path: Path, data: bytes, mode: str = 'wb') -> None:
+        """Write a local file, natively async when aiofiles is available
+
+        Full rewrites go to a temp file in the same directory and are
+        renamed into place, so a crash mid-write never leaves a
+        half-written words file. Appends write in place by nature.
+        """
+        if mode == 'ab':
+            if aiofiles is not None:
+                async with aiofiles.open(path, 'ab') as file:
+                    await file.write(data)
+            else:
+                loop = asyncio.get_event_loop()
+
+                def _append():
+                    with open(path, 'ab') as file:
+                        file.write(data)
+
+                await loop.run_in_executor(None, _append)
+            return
+
+        fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix='.words.', suffix='.tmp')
+        try:
+            if aiofiles is not None:
+                os.close(fd)
+                async with aiofiles.open(tmp, 'wb') as file:
+                    await file.write(data)
+            else:
+                loop = asyncio.get_event_loop()
+
+                def _write():
+                    with os.fdopen(fd, 'wb') as file:
+                        file.write(data)
+                        file.flush()
+                        os.fsync(file.fileno())
+
+                await loop.run_in_executor(None, _write)
+            os.replace(tmp, path)
+        except Exception:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
     async def _create_sample_words_file(self):
         """Create sample words file locally"""
         sample_words = [
@@ -199,66 +433,329 @@ class CivoWordManager:
         
         try:
             words_path = Path(self.words_file_path)
-            words_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None,
-                lambda: words_path.write_text('\n'.join(sample_words), encoding='utf-8')
-            )
-            
+
+            await self._write_file(words_path, '\n'.join(sample_words).encode('utf-8'))
+
             logger.info(f"Created sample words file with {len(sample_words)} words")
         except Exception as e:
             logger.error(f"Failed to create sample words file: {e}")
     
-    async def save_words_to_storage(self) -> bool:
-        """Save current words list to storage"""
+    # S3 multipart rules: every part except the last must be at least
+    # 5 MiB, so the copy-then-append trick only works once the existing
+    # object is that big; below it a full rewrite is cheap anyway
+    MIN_APPEND_COPY_SIZE = 5 * 1024 * 1024
+
+    # How long the writer waits after a mutation before flushing, so a
+    # burst of add/remove calls collapses into one storage write
+    WRITE_DEBOUNCE = 0.05
+
+    def _mark_dirty(self, new_words: Optional[List[str]] = None):
+        """Record a mutation and wake the debounced writer
+
+        Adds pass new_words so the flush can take the append path;
+        removals leave it out and force a full rewrite, which also
+        supersedes any appends still waiting in the buffer.
+        """
+        self._version += 1
+        self._words_cache = None
+        if self._needs_rewrite:
+            pass  # the pending rewrite already covers every mutation
+        elif new_words is not None:
+            self._pending_appends.extend(new_words)
+        else:
+            self._needs_rewrite = True
+            self._pending_appends.clear()
+
+        if self._dirty is None:
+            self._dirty = asyncio.Event()
+        self._dirty.set()
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = asyncio.create_task(self._writer_loop())
+
+    async def _writer_loop(self):
+        """Coalesce bursts of mutations into single storage writes"""
+        while self._dirty.is_set():
+            self._dirty.clear()
+            # Let the rest of the burst land before writing
+            await asyncio.sleep(self.WRITE_DEBOUNCE)
+            await self._flush_pending()
+
+    async def flush(self) -> bool:
+        """Flush pending mutations to storage immediately
+
+        Mutation methods return as soon as memory is updated; callers
+        that need durability await this before replying.
+        """
+        if self._dirty is not None:
+            self._dirty.clear()
+        return await self._flush_pending()
+
+    async def _flush_pending(self) -> bool:
+        """Write whatever the debounce window collected"""
+        appends, self._pending_appends = self._pending_appends, []
+        rewrite, self._needs_rewrite = self._needs_rewrite, False
+
+        if rewrite:
+            success = await self.save_words_to_storage()
+            if not success:
+                # Memory stays the source of truth; retry on the next flush
+                self._needs_rewrite = True
+            return success
+
+        if appends:
+            success = await self.save_words_to_storage(new_words=appends)
+            if not success:
+                # Rollback on save failure
+                self.words_set.difference_update(appends)
+                self._version += 1
+                self._words_cache = None
+            return success
+
+        return True
+
+    async def save_words_to_storage(self, new_words: Optional[List[str]] = None) -> bool:
+        """Save current words list to storage
+
+        Adds pass new_words and take the cheap append path, which writes
+        only the new bytes; removals (or callers wanting a clean file)
+        omit it and rewrite the whole file. The file stays unsorted on
+        disk — compact() restores sorted order on demand.
+        """
         try:
-            content = '\n'.join(sorted(self.words_list))
-            
-            if self.storage_type == "civo_object_store" and self.s3_client:
-                return await self._save_to_object_store(content)
-            else:
-                return await self._save_to_file(content)
-                
+            if new_words:
+                return await self._flush_appends(new_words)
+            return await self._rewrite_full()
+
         except Exception as e:
             logger.error(f"Failed to save words to storage: {e}")
             return False
-    
-    async def _save_to_object_store(self, content: str) -> bool:
+
+    async def _flush_appends(self, new_words: List[str]) -> bool:
+        """Append only the new words to storage"""
+        # The file is stored without a trailing newline, so the separator
+        # leads; an empty file just gains a blank first line, which the
+        # loaders already strip
+        suffix = ('\n' + '\n'.join(new_words)).encode('utf-8')
+
+        if self.storage_type == "civo_object_store" and self.s3_client:
+            return await self._append_to_object_store(suffix)
+        else:
+            return await self._append_to_file(suffix)
+
+    def _serialize_bytes(self) -> bytes:
+        """Serialize the collection straight to bytes, once per version
+
+        Skipping the intermediate joined str halves peak memory during a
+        save; the memo lets a rewrite and anything else wanting the same
+        body share one encoding pass.
+        """
+        if self._serialized_cache and self._serialized_cache[0] == self._version:
+            return self._serialized_cache[1]
+        body = b'\n'.join(w.encode('utf-8') for w in self.words_list)
+        self._serialized_cache = (self._version, body)
+        return body
+
+    async def _rewrite_full(self) -> bool:
+        """Rewrite the whole words file in storage"""
+        body = self._serialize_bytes()
+
+        if self.storage_type == "civo_object_store" and self.s3_client:
+            return await self._save_to_object_store(body)
+        else:
+            return await self._save_to_file(body)
+
+    async def compact(self) -> bool:
+        """Sort the words list and rewrite storage in one pass"""
+        self.words_list.sort()
+        # Same version, different byte order: drop the stale memo
+        self._serialized_cache = None
+        return await self._rewrite_full()
+
+    async def _append_to_object_store(self, suffix: bytes) -> bool:
+        """Append bytes to the words object without re-uploading it
+
+        Uses a multipart upload whose first part is a server-side copy of
+        the existing object (upload_part_copy) and whose second part is
+        the new suffix, so only the new bytes leave this process.
+        """
+        try:
+            head = await self._s3_op('head_object', Bucket=self.bucket_name, Key=self.words_key)
+
+            if head['ContentLength'] < self.MIN_APPEND_COPY_SIZE:
+                return await self._rewrite_full()
+
+            create_kwargs = {'ContentType': "text/plain"}
+            if head.get('ContentEncoding') == 'gzip':
+                # Concatenated gzip members decompress as concatenated
+                # streams, so appending a compressed suffix to a gzipped
+                # object yields a valid file
+                suffix = gzip.compress(suffix, compresslevel=6)
+                create_kwargs['ContentEncoding'] = 'gzip'
+
+            upload = await self._s3_op(
+                'create_multipart_upload',
+                Bucket=self.bucket_name,
+                Key=self.words_key,
+                **create_kwargs
+            )
+            upload_id = upload['UploadId']
+
+            try:
+                copy_part = await self._s3_op(
+                    'upload_part_copy',
+                    Bucket=self.bucket_name,
+                    Key=self.words_key,
+                    UploadId=upload_id,
+                    PartNumber=1,
+                    CopySource={'Bucket': self.bucket_name, 'Key': self.words_key}
+                )
+                new_part = await self._s3_op(
+                    'upload_part',
+                    Bucket=self.bucket_name,
+                    Key=self.words_key,
+                    UploadId=upload_id,
+                    PartNumber=2,
+                    Body=suffix
+                )
+                await self._s3_op(
+                    'complete_multipart_upload',
+                    Bucket=self.bucket_name,
+                    Key=self.words_key,
+                    UploadId=upload_id,
+                    MultipartUpload={'Parts': [
+                        {'PartNumber': 1, 'ETag': copy_part['CopyPartResult']['ETag']},
+                        {'PartNumber': 2, 'ETag': new_part['ETag']}
+                    ]}
+                )
+            except Exception:
+                # Abandoned multipart uploads keep billing for their parts
+                await self._s3_op(
+                    'abort_multipart_upload',
+                    Bucket=self.bucket_name,
+                    Key=self.words_key,
+                    UploadId=upload_id
+                )
+                raise
+
+            appended = suffix.count(b'\n')
+            logger.info(f"Appended {appended} words to Civo Object Store")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to append words to Civo Object Store: {e}")
+            self._conn_test_cache = (0.0, None)
+            return False
+
+    async def _append_to_file(self, suffix: bytes) -> bool:
+        """Append bytes to the local words file"""
+        try:
+            words_path = Path(self.words_file_path)
+
+            await self._write_file(words_path, suffix, mode='ab')
+
+            appended = suffix.count(b'\n')
+            logger.info(f"Appended {appended} words to file")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to append words to file: {e}")
+            return False
+
+
+    # Bodies above one part size upload as parallel multipart chunks;
+    # below it the three extra API calls would cost more than they save
+    MULTIPART_PART_SIZE = 8 * 1024 * 1024
+
+    async def _put_object_multipart(self, key: str, body: bytes,
+                                    part_size: int = MULTIPART_PART_SIZE,
+                                    content_encoding: Optional[str] = None) -> None:
+        """Upload a large object as concurrently PUT multipart chunks"""
+        create_kwargs = {'ContentType': "text/plain"}
+        if content_encoding:
+            create_kwargs['ContentEncoding'] = content_encoding
+        upload = await self._s3_op(
+            'create_multipart_upload',
+            Bucket=self.bucket_name,
+            Key=key,
+            **create_kwargs
+        )
+        upload_id = upload['UploadId']
+
+        try:
+            chunks = [body[i:i + part_size] for i in range(0, len(body), part_size)]
+            uploaded = await asyncio.gather(*(
+                self._s3_op(
+                    'upload_part',
+                    Bucket=self.bucket_name,
+                    Key=key,
+                    UploadId=upload_id,
+                    PartNumber=num,
+                    Body=chunk
+                )
+                for num, chunk in enumerate(chunks, start=1)
+            ))
+            await self._s3_op(
+                'complete_multipart_upload',
+                Bucket=self.bucket_name,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={'Parts': [
+                    {'PartNumber': num, 'ETag': part['ETag']}
+                    for num, part in enumerate(uploaded, start=1)
+                ]}
+            )
+        except Exception:
+            # Abandoned multipart uploads keep billing for their parts
+            await self._s3_op(
+                'abort_multipart_upload',
+                Bucket=self.bucket_name,
+                Key=key,
+                UploadId=upload_id
+            )
+            raise
+
+    async def _save_to_object_store(self, body: bytes) -> bool:
         """Save words to Civo Object Store"""
         try:
+            # Word lists compress 5-10x; the store keeps the gzipped
+            # bytes and the loader decompresses on ContentEncoding.
+            # Compression runs off the loop -- it's pure CPU
             loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None,
-                lambda: self.s3_client.put_object(
+            gz = await loop.run_in_executor(
+                None, functools.partial(gzip.compress, body, 6)
+            )
+
+            if len(gz) > self.MULTIPART_PART_SIZE:
+                await self._put_object_multipart(self.words_key, gz, content_encoding='gzip')
+            else:
+                await self._s3_op(
+                    'put_object',
                     Bucket=self.bucket_name,
                     Key=self.words_key,
-                    Body=content,
-                    ContentType="text/plain"
+                    Body=gz,
+                    ContentType="text/plain",
+                    ContentEncoding='gzip',
+                    # Lets the store verify the payload without a
+                    # second hashing round-trip
+                    ContentMD5=base64.b64encode(hashlib.md5(gz).digest()).decode()
                 )
-            )
-            
-            logger.info(f"Saved {len(self.words_list)} words to Civo Object Store")
+
+            logger.info(f"Saved {len(self.words_set)} words to Civo Object Store")
             return True
             
         except Exception as e:
             logger.error(f"Failed to save words to Civo Object Store: {e}")
+            self._conn_test_cache = (0.0, None)
             return False
     
-    async def _save_to_file(self, content: str) -> bool:
+    async def _save_to_file(self, body: bytes) -> bool:
         """Save words to local file"""
         try:
             words_path = Path(self.words_file_path)
-            words_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None,
-                lambda: words_path.write_text(content, encoding='utf-8')
-            )
-            
-            logger.info(f"Saved {len(self.words_list)} words to file")
+
+            await self._write_file(words_path, body)
+
+            logger.info(f"Saved {len(self.words_set)} words to file")
             return True
             
         except Exception as e:
@@ -284,28 +781,33 @@ class CivoWordManager:
         words = await self.get_words_list()
         return len(words)
     
+    @functools.lru_cache(maxsize=65536)
+    def _exists_cached(self, word: str, version: int) -> bool:
+        # Sets aren't hashable, so the collection's version number stands
+        # in for it in the cache key
+        return word in self.words_set
+
     async def word_exists(self, word: str) -> bool:
-        """Check if a word exists in the collection"""
+        """Check if a word exists in the collection
+
+        Query streams tend to repeat the same words, so an LRU keyed on
+        (word, collection version) lets hot lookups skip the lower() and
+        set hash entirely.
+        """
         if not self.words_set:
             await self.get_words_list()
-        return word.lower() in self.words_set
+        return self._exists_cached(word.lower(), self._version)
     
     async def add_word(self, word: str) -> bool:
         """Add a single word to the collection"""
         try:
             word_lower = word.lower().strip()
             if word_lower and word_lower not in self.words_set:
-                self.words_list.append(word_lower)
                 self.words_set.add(word_lower)
-                
-                # Save to storage
-                success = await self.save_words_to_storage()
-                if not success:
-                    # Rollback on save failure
-                    self.words_list.remove(word_lower)
-                    self.words_set.discard(word_lower)
-                    return False
-                
+
+                # Memory-only; the debounced writer persists the append
+                self._mark_dirty(new_words=[word_lower])
+
                 logger.info(f"Added word: {word_lower}")
                 return True
             
@@ -318,33 +820,31 @@ class CivoWordManager:
     async def add_words(self, words: List[str]) -> Tuple[int, int]:
         """Add multiple words to the collection"""
         try:
-            added_count = 0
             total_count = len(words)
-            
-            # Process words
-            new_words = []
-            for word in words:
-                word_lower = word.lower().strip()
-                if word_lower and word_lower not in self.words_set:
-                    new_words.append(word_lower)
-                    self.words_set.add(word_lower)
-                    added_count += 1
-            
+
+            # Normalize and dedupe in one C-level set pass, then a single
+            # difference finds the genuinely new words
+            normed = {word.lower().strip() for word in words}
+            normed.discard('')
+
+            # Clients retrying the same batch (and nothing else mutating
+            # in between) can be answered without another set difference
+            sig = frozenset(normed)
+            if self._last_batch_sig == (sig, self._version):
+                return 0, total_count
+
+            new_words = normed - self.words_set
+
             if new_words:
-                self.words_list.extend(new_words)
-                
-                # Save to storage
-                success = await self.save_words_to_storage()
-                if not success:
-                    # Rollback on save failure
-                    for word in new_words:
-                        self.words_list.remove(word)
-                        self.words_set.discard(word)
-                    return 0, total_count
-                
-                logger.info(f"Added {added_count} new words out of {total_count} submitted")
-            
-            return added_count, total_count
+                self.words_set |= new_words
+
+                # Memory-only; the debounced writer persists the append
+                self._mark_dirty(new_words=list(new_words))
+
+                logger.info(f"Added {len(new_words)} new words out of {total_count} submitted")
+
+            self._last_batch_sig = (sig, self._version)
+            return len(new_words), total_count
             
         except Exception as e:
             logger.error(f"Failed to add words: {e}")
@@ -355,17 +855,11 @@ class CivoWordManager:
         try:
             word_lower = word.lower().strip()
             if word_lower in self.words_set:
-                self.words_list.remove(word_lower)
                 self.words_set.discard(word_lower)
-                
-                # Save to storage
-                success = await self.save_words_to_storage()
-                if not success:
-                    # Rollback on save failure
-                    self.words_list.append(word_lower)
-                    self.words_set.add(word_lower)
-                    return False
-                
+
+                # Memory-only; the debounced writer rewrites the file
+                self._mark_dirty()
+
                 logger.info(f"Removed word: {word_lower}")
                 return True
             
@@ -378,31 +872,22 @@ class CivoWordManager:
     async def remove_words(self, words: List[str]) -> Tuple[int, int]:
         """Remove multiple words from the collection"""
         try:
-            removed_count = 0
             total_count = len(words)
-            
-            removed_words = []
-            for word in words:
-                word_lower = word.lower().strip()
-                if word_lower in self.words_set:
-                    removed_words.append(word_lower)
-                    self.words_list.remove(word_lower)
-                    self.words_set.discard(word_lower)
-                    removed_count += 1
-            
-            if removed_words:
-                # Save to storage
-                success = await self.save_words_to_storage()
-                if not success:
-                    # Rollback on save failure
-                    for word in removed_words:
-                        self.words_list.append(word)
-                        self.words_set.add(word)
-                    return 0, total_count
-                
-                logger.info(f"Removed {removed_count} words out of {total_count} submitted")
-            
-            return removed_count, total_count
+
+            # One intersection finds the words actually present; the old
+            # per-word list.remove made a batch of n removes O(n^2)
+            normed = {word.lower().strip() for word in words}
+            to_remove = normed & self.words_set
+
+            if to_remove:
+                self.words_set -= to_remove
+
+                # Memory-only; the debounced writer rewrites the file
+                self._mark_dirty()
+
+                logger.info(f"Removed {len(to_remove)} words out of {total_count} submitted")
+
+            return len(to_remove), total_count
             
         except Exception as e:
             logger.error(f"Failed to remove words: {e}")
@@ -421,20 +906,26 @@ class CivoWordManager:
     
     async def get_storage_info(self) -> Dict[str, Any]:
         """Get information about the current storage configuration"""
-        return self.storage_info.copy()
+        # Immutable mapping: safe to return without a per-call copy
+        return self.storage_info
     
+    # How long a connection-test result stays fresh; failures elsewhere
+    # reset the cache so a real outage shows up immediately
+    CONN_TEST_TTL = 30.0
+
     async def test_storage_connection(self) -> Dict[str, Any]:
-        """Test the storage connection"""
+        """Test the storage connection, caching the result briefly"""
+        now = time.monotonic()
+        ts, cached = self._conn_test_cache
+        if cached is not None and now - ts < self.CONN_TEST_TTL:
+            return cached
+
         try:
             if self.storage_type == "civo_object_store" and self.s3_client:
                 # Test object store connection
-                loop = asyncio.get_event_loop()
-                await loop.run_in_executor(
-                    None,
-                    lambda: self.s3_client.head_bucket(Bucket=self.bucket_name)
-                )
-                
-                return {
+                await self._s3_op('head_bucket', Bucket=self.bucket_name)
+
+                result = {
                     "success": True,
                     "storage_type": self.storage_type,
                     "provider": "civo",
@@ -445,66 +936,69 @@ class CivoWordManager:
                 # Test file storage
                 words_path = Path(self.words_file_path)
                 accessible = words_path.parent.exists() and os.access(words_path.parent, os.W_OK)
-                
-                return {
+
+                result = {
                     "success": accessible,
                     "storage_type": self.storage_type,
                     "provider": "local",
                     "message": "File storage accessible" if accessible else "File storage not accessible",
                     "file_path": str(words_path)
                 }
-                
+
         except Exception as e:
             logger.error(f"Storage connection test failed: {e}")
-            return {
+            result = {
                 "success": False,
                 "storage_type": self.storage_type,
                 "message": f"Connection test failed: {str(e)}"
             }
+
+        self._conn_test_cache = (now, result)
+        return result
     
     async def backup_words(self) -> Dict[str, Any]:
         """Create a backup of current words"""
         try:
-            timestamp = datetime.now().isoformat()
-            backup_key = f"backups/words-backup-{timestamp}.txt"
+            # Nanosecond keys can't collide under concurrent backups and
+            # don't rewind with local-time DST the way isoformat() can;
+            # the human-readable UTC stamp only goes in metadata
+            ts_ns = time.time_ns()
+            timestamp = datetime.fromtimestamp(ts_ns / 1e9, tz=timezone.utc).isoformat()
+            backup_key = f"backups/words-backup-{ts_ns}.txt"
             
             if self.storage_type == "civo_object_store" and self.s3_client:
-                # Backup to object store
-                content = '\n'.join(sorted(self.words_list))
-                
-                loop = asyncio.get_event_loop()
-                await loop.run_in_executor(
-                    None,
-                    lambda: self.s3_client.put_object(
-                        Bucket=self.bucket_name,
-                        Key=backup_key,
-                        Body=content,
-                        ContentType="text/plain",
-                        Metadata={"backup_timestamp": timestamp}
-                    )
+                # Flush pending mutations so the live object matches
+                # memory, then back it up with a server-side copy --
+                # nothing is re-serialized and no bytes leave the store
+                await self.flush()
+
+                await self._s3_op(
+                    'copy_object',
+                    Bucket=self.bucket_name,
+                    Key=backup_key,
+                    CopySource={'Bucket': self.bucket_name, 'Key': self.words_key},
+                    Metadata={"backup_timestamp": timestamp},
+                    MetadataDirective='REPLACE'
                 )
-                
+
                 return {
                     "success": True,
                     "backup_location": f"{self.bucket_name}/{backup_key}",
-                    "word_count": len(self.words_list),
+                    "word_count": len(self.words_set),
                     "timestamp": timestamp
                 }
             else:
                 # Backup to local file
-                backup_path = Path(f"{self.words_file_path}.backup.{timestamp}")
-                content = '\n'.join(sorted(self.words_list))
-                
-                loop = asyncio.get_event_loop()
-                await loop.run_in_executor(
-                    None,
-                    lambda: backup_path.write_text(content, encoding='utf-8')
-                )
-                
+                backup_path = Path(f"{self.words_file_path}.backup.{ts_ns}")
+                content = '\n'.join(sorted(self.words_set)).encode('utf-8')
+
+                await self._write_file(backup_path, content)
+
+
                 return {
                     "success": True,
                     "backup_location": str(backup_path),
-                    "word_count": len(self.words_list),
+                    "word_count": len(self.words_set),
                     "timestamp": timestamp
                 }
                 